@@ -17,8 +17,15 @@
 Geometric operations.
 """
 
+import math
+
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 
 def distance_matrix(coordinates_a, coordinates_b):
     """
@@ -122,3 +129,133 @@ def dihedral_phase(coordinates):
     if dihedral_angle < -np.pi:
         dihedral_angle += 2 * np.pi
     return dihedral_angle
+
+
+def angle_degrees(coordinates):
+    """
+    Calculate the angle in degrees defined by 3 points.
+
+    The function is written with scalar operations only so that it can be
+    compiled with numba when the library is available. For the small, fixed
+    size input it works on, this avoids the cost of dispatching a series of
+    numpy operations on tiny arrays.
+
+    Parameters
+    ----------
+    coordinates: numpy.ndarray
+        The coordinates of 3 points defining the angle. Each row corresponds
+        to a point, and each column to a dimension.
+
+    Returns
+    -------
+    float
+        The calculated angle between 0 and 180 degrees.
+    """
+    ba_x = coordinates[0, 0] - coordinates[1, 0]
+    ba_y = coordinates[0, 1] - coordinates[1, 1]
+    ba_z = coordinates[0, 2] - coordinates[1, 2]
+    bc_x = coordinates[2, 0] - coordinates[1, 0]
+    bc_y = coordinates[2, 1] - coordinates[1, 1]
+    bc_z = coordinates[2, 2] - coordinates[1, 2]
+    nominator = ba_x * bc_x + ba_y * bc_y + ba_z * bc_z
+    denominator = (
+        math.sqrt(ba_x ** 2 + ba_y ** 2 + ba_z ** 2)
+        * math.sqrt(bc_x ** 2 + bc_y ** 2 + bc_z ** 2)
+    )
+    cosine = nominator / denominator
+    # Floating errors at the limits may cause issues.
+    if cosine > 1.0:
+        cosine = 1.0
+    elif cosine < -1.0:
+        cosine = -1.0
+    return math.degrees(math.acos(cosine))
+
+
+def _dihedral_radians(coordinates):
+    """
+    Scalar-only implementation of :func:`dihedral`; see :func:`angle_degrees`
+    for the rationale.
+    """
+    ab_x = coordinates[1, 0] - coordinates[0, 0]
+    ab_y = coordinates[1, 1] - coordinates[0, 1]
+    ab_z = coordinates[1, 2] - coordinates[0, 2]
+    bc_x = coordinates[2, 0] - coordinates[1, 0]
+    bc_y = coordinates[2, 1] - coordinates[1, 1]
+    bc_z = coordinates[2, 2] - coordinates[1, 2]
+    cd_x = coordinates[3, 0] - coordinates[2, 0]
+    cd_y = coordinates[3, 1] - coordinates[2, 1]
+    cd_z = coordinates[3, 2] - coordinates[2, 2]
+    normal_abc_x = ab_y * bc_z - ab_z * bc_y
+    normal_abc_y = ab_z * bc_x - ab_x * bc_z
+    normal_abc_z = ab_x * bc_y - ab_y * bc_x
+    normal_bcd_x = bc_y * cd_z - bc_z * cd_y
+    normal_bcd_y = bc_z * cd_x - bc_x * cd_z
+    normal_bcd_z = bc_x * cd_y - bc_y * cd_x
+    psin = (
+        (normal_abc_x * cd_x + normal_abc_y * cd_y + normal_abc_z * cd_z)
+        * math.sqrt(bc_x ** 2 + bc_y ** 2 + bc_z ** 2)
+    )
+    pcos = (
+        normal_abc_x * normal_bcd_x
+        + normal_abc_y * normal_bcd_y
+        + normal_abc_z * normal_bcd_z
+    )
+    return math.atan2(psin, pcos)
+
+
+def dihedral_degrees(coordinates):
+    """
+    Calculate the dihedral angle in degrees.
+
+    Scalar-only, numba compilable, equivalent of
+    ``numpy.degrees(dihedral(coordinates))``.
+
+    Parameters
+    ----------
+    coordinates: numpy.ndarray
+        The coordinates of 4 points defining the dihedral angle. Each row
+        corresponds to a point, and each column to a dimension.
+
+    Returns
+    -------
+    float
+        The calculated angle between -180 and +180 degrees.
+    """
+    return math.degrees(_dihedral_radians(coordinates))
+
+
+def dihedral_phase_degrees(coordinates):
+    """
+    Calculate a dihedral angle in degrees with a -180 degrees phase correction.
+
+    Scalar-only, numba compilable, equivalent of
+    ``numpy.degrees(dihedral_phase(coordinates))``.
+
+    Parameters
+    ----------
+    coordinates: numpy.ndarray
+        The coordinates of 4 points defining the dihedral angle. Each row
+        corresponds to a point, and each column to a dimension.
+
+    Returns
+    -------
+    float
+        The calculated angle between -180 and +180 degrees.
+
+    See Also
+    --------
+    dihedral_degrees
+    """
+    dihedral_angle = _dihedral_radians(coordinates) - math.pi
+    if dihedral_angle > math.pi:
+        dihedral_angle -= 2 * math.pi
+    if dihedral_angle < -math.pi:
+        dihedral_angle += 2 * math.pi
+    return math.degrees(dihedral_angle)
+
+
+if numba is not None:
+    _dihedral_radians = numba.njit(cache=True)(_dihedral_radians)
+    angle_degrees = numba.njit(cache=True)(angle_degrees)
+    dihedral_degrees = numba.njit(cache=True)(dihedral_degrees)
+    dihedral_phase_degrees = numba.njit(cache=True)(dihedral_phase_degrees)
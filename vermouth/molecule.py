@@ -26,6 +26,10 @@ from . import geometry
 from . import utils
 
 
+# Used as a `dict.get` default to tell apart "the key is missing" from "the
+# key is set to None".
+_SENTINEL = object()
+
 Interaction = namedtuple('Interaction', 'atoms parameters meta')
 DeleteInteraction = namedtuple('DeleteInteraction',
                                'atoms atom_attrs parameters meta')
@@ -54,6 +58,8 @@ class LinkPredicate:
         The per-instance value that serve as reference. How this value is
         treated depends on the subclass.
     """
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -99,11 +105,22 @@ class Choice(LinkPredicate):
     value: list
         The list of value in which to look for the attribute.
     """
+    __slots__ = ('_lookup',)
+
+    def __init__(self, value):
+        super().__init__(value)
+        # Set membership is O(1) where the list scan is O(n); we fall back to
+        # the list if any of the values is not hashable.
+        try:
+            self._lookup = frozenset(value)
+        except TypeError:
+            self._lookup = value
+
     def match(self, node, key):
         """
         Apply the comparison.
         """
-        return node.get(key) in self.value
+        return node.get(key) in self._lookup
 
 
 class NotDefinedOrNot(LinkPredicate):
@@ -124,11 +141,14 @@ class NotDefinedOrNot(LinkPredicate):
     value:
         The value the attribute is tested not to be.
     """
+    __slots__ = ()
+
     def match(self, node, key):
         """
         Apply the comparison.
         """
-        return key not in node or node[key] != self.value
+        value = node.get(key, _SENTINEL)
+        return value is _SENTINEL or value != self.value
 
 
 class LinkParameterEffector:
@@ -167,6 +187,8 @@ class LinkParameterEffector:
     .. automethod:: __call__
     .. automethod:: _apply
     """
+    __slots__ = ('keys', 'format', '_format_template')
+
     n_keys_asked = None
     """Class attribute describing the number of keys required."""
 
@@ -195,6 +217,12 @@ class LinkParameterEffector:
                 .format(self.__class__.__name__, self.n_keys_asked, len(keys))
             )
         self.format = format_spec
+        # The format template only depends on the format spec, so it is built
+        # once here rather than once per call.
+        if format_spec is not None:
+            self._format_template = '{:' + format_spec + '}'
+        else:
+            self._format_template = None
 
     def __eq__(self, other):
         return (self.__class__ == other.__class__
@@ -218,8 +246,8 @@ class LinkParameterEffector:
         """
         keys = [match[key] for key in self.keys]
         result = self._apply(molecule, keys)
-        if self.format is not None:
-            result = '{value:{format}}'.format(value=result, format=self.format)
+        if self._format_template is not None:
+            result = self._format_template.format(result)
         return result
 
     def _apply(self, molecule, keys):
@@ -246,19 +274,45 @@ class LinkParameterEffector:
         raise NotImplementedError(msg)
 
 
+def _gather_positions(molecule, keys):
+    """
+    Collect the positions of the given nodes as a single array.
+
+    Parameters
+    ----------
+    molecule: Molecule
+        The molecule from which to read the positions.
+    keys: list
+        The keys of the nodes whose position is needed.
+
+    Returns
+    -------
+    numpy.ndarray
+        A C-contiguous float array with one row per node and one column per
+        dimension.
+    """
+    # Building the array in a single pass is cheaper than stacking the
+    # individual position arrays, and guarantees a contiguous float array
+    # for the geometry functions downstream.
+    node_view = molecule.nodes
+    return np.array([node_view[key]['position'] for key in keys], dtype=float)
+
+
 class ParamDistance(LinkParameterEffector):
     """
     Calculate the distance between a pair of nodes.
     """
+    __slots__ = ()
+
     n_keys_asked = 2
 
     def _apply(self, molecule, keys):
         # This will raise a ValueError if an atom is missing, or if an
         # atom does not have position.
-        positions = np.stack([molecule.nodes[key]['position'] for key in keys])
+        positions = _gather_positions(molecule, keys)
         # We assume there are two rows; which we can since we checked earlier
         # that exactly two atom keys were passed.
-        distance = np.sqrt(np.sum(np.diff(positions, axis=0)**2))
+        distance = np.linalg.norm(positions[1] - positions[0])
         return distance
 
 
@@ -266,32 +320,32 @@ class ParamAngle(LinkParameterEffector):
     """
     Calculate the angle in degrees between three consecutive nodes.
     """
+    __slots__ = ()
+
     n_keys_asked = 3
 
     @staticmethod
     def _apply(molecule, keys):
         # This will raise a ValueError if an atom is missing, or if an
         # atom does not have position.
-        positions = np.stack([molecule.nodes[key]['position'] for key in keys])
-        vector_ba = positions[0, :] - positions[1, :]
-        vector_bc = positions[2, :] - positions[1, :]
-        angle = geometry.angle(vector_ba, vector_bc)
-        return np.degrees(angle)
+        positions = _gather_positions(molecule, keys)
+        return geometry.angle_degrees(positions)
 
 
 class ParamDihedral(LinkParameterEffector):
     """
     Calculate the dihedral angle in degrees defined by four nodes.
     """
+    __slots__ = ()
+
     n_keys_asked = 4
 
     @staticmethod
     def _apply(molecule, keys):
         # This will raise a ValueError if an atom is missing, or if an
         # atom does not have position.
-        positions = np.stack([molecule.nodes[key]['position'] for key in keys])
-        angle = geometry.dihedral(positions)
-        return np.degrees(angle)
+        positions = _gather_positions(molecule, keys)
+        return geometry.dihedral_degrees(positions)
 
 
 class ParamDihedralPhase(LinkParameterEffector):
@@ -299,15 +353,99 @@ class ParamDihedralPhase(LinkParameterEffector):
     Calculate the dihedral angle in degrees defined by four nodes shifted by
     -180 degrees.
     """
+    __slots__ = ()
+
     n_keys_asked = 4
 
     @staticmethod
     def _apply(molecule, keys):
         # This will raise a ValueError if an atom is missing, or if an
         # atom does not have position.
-        positions = np.stack([molecule.nodes[key]['position'] for key in keys])
-        angle = geometry.dihedral_phase(positions)
-        return np.degrees(angle)
+        positions = _gather_positions(molecule, keys)
+        return geometry.dihedral_phase_degrees(positions)
+
+
+def _batch_distances(positions, rows):
+    """
+    Compute the distances for a batch of node pairs.
+
+    Parameters
+    ----------
+    positions: numpy.ndarray
+        The gathered positions, one row per node.
+    rows: numpy.ndarray
+        One row per distance, each row holding the 2 indices of the involved
+        nodes in `positions`.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    vectors = positions[rows[:, 1]] - positions[rows[:, 0]]
+    return np.sqrt(np.sum(vectors ** 2, axis=1))
+
+
+def _batch_angles(positions, rows):
+    """
+    Compute the angles in degrees for a batch of node triplets.
+
+    See Also
+    --------
+    _batch_distances
+    """
+    vectors_ba = positions[rows[:, 0]] - positions[rows[:, 1]]
+    vectors_bc = positions[rows[:, 2]] - positions[rows[:, 1]]
+    nominators = np.sum(vectors_ba * vectors_bc, axis=1)
+    denominators = (np.linalg.norm(vectors_ba, axis=1)
+                    * np.linalg.norm(vectors_bc, axis=1))
+    # Floating errors at the limits may cause issues.
+    cosines = np.clip(nominators / denominators, -1, 1)
+    return np.degrees(np.arccos(cosines))
+
+
+def _batch_dihedrals(positions, rows):
+    """
+    Compute the dihedral angles in degrees for a batch of node quadruplets.
+
+    See Also
+    --------
+    _batch_distances
+    """
+    vectors_ab = positions[rows[:, 1]] - positions[rows[:, 0]]
+    vectors_bc = positions[rows[:, 2]] - positions[rows[:, 1]]
+    vectors_cd = positions[rows[:, 3]] - positions[rows[:, 2]]
+    normals_abc = np.cross(vectors_ab, vectors_bc)
+    normals_bcd = np.cross(vectors_bc, vectors_cd)
+    psin = (np.sum(normals_abc * vectors_cd, axis=1)
+            * np.linalg.norm(vectors_bc, axis=1))
+    pcos = np.sum(normals_abc * normals_bcd, axis=1)
+    return np.degrees(np.arctan2(psin, pcos))
+
+
+def _batch_dihedral_phases(positions, rows):
+    """
+    Compute dihedral angles in degrees, with a -180 degrees phase correction,
+    for a batch of node quadruplets.
+
+    See Also
+    --------
+    _batch_distances
+    """
+    angles = _batch_dihedrals(positions, rows) - 180
+    angles[angles > 180] -= 360
+    angles[angles < -180] += 360
+    return angles
+
+
+# Maps each effector class to the kernel evaluating a whole batch of that
+# class at once. The lookup is done on the exact type: unknown subclasses fall
+# back to their own __call__.
+_BATCH_EFFECTOR_KERNELS = {
+    ParamDistance: _batch_distances,
+    ParamAngle: _batch_angles,
+    ParamDihedral: _batch_dihedrals,
+    ParamDihedralPhase: _batch_dihedral_phases,
+}
 
 
 class Molecule(nx.Graph):
@@ -428,9 +566,9 @@ class Molecule(nx.Graph):
         """
         # TODO: should just be an alias for nodes. If you need the attributes,
         #       do g.nodes(data=<attr>) or g.nodes(data=True)
-        for node in self.nodes():
-            node_attr = self.nodes[node]
-            yield node, node_attr
+        # We iterate over the underlying node dict rather than the NodeView to
+        # avoid the view indirection on this hot path.
+        yield from self._node.items()
 
     @property
     def sorted_nodes(self):
@@ -487,6 +625,33 @@ class Molecule(nx.Graph):
 
         return subgraph
 
+    def freeze(self):
+        """
+        Convert the interaction lists to tuples.
+
+        Tuples are more compact than the over-allocating lists, which matters
+        for the read-dominated phase after a topology is built. The molecule
+        can still be modified afterwards: the mutating methods transparently
+        thaw the interaction storage of the type they touch back to a list.
+
+        Note that a frozen interaction category does not compare equal to its
+        list-backed equivalent, so molecules should be in the same state when
+        compared.
+        """
+        for type_ in list(self.interactions):
+            self.interactions[type_] = tuple(self.interactions[type_])
+
+    def _mutable_interactions(self, type_):
+        """
+        Returns the interactions of `type_` as a mutable list, thawing the
+        storage if it was frozen with :meth:`freeze`.
+        """
+        interactions = self.interactions[type_]
+        if isinstance(interactions, tuple):
+            interactions = list(interactions)
+            self.interactions[type_] = interactions
+        return interactions
+
     def add_interaction(self, type_, atoms, parameters, meta=None):
         """
         Add an interaction of the specified type with the specified parameters
@@ -512,11 +677,15 @@ class Molecule(nx.Graph):
         """
         if meta is None:
             meta = {}
+        # Coerce to a tuple only when needed, and before the membership check
+        # so that `atoms` can be a generator.
+        if not isinstance(atoms, tuple):
+            atoms = tuple(atoms)
         for atom in atoms:
             if atom not in self:
                 raise KeyError('Unknown atom {}'.format(atom))
-        self.interactions[type_].append(
-            Interaction(atoms=tuple(atoms), parameters=parameters, meta=meta)
+        self._mutable_interactions(type_).append(
+            Interaction(atoms=atoms, parameters=parameters, meta=meta)
         )
 
     def add_or_replace_interaction(self, type_, atoms, parameters, meta=None, citations=None):
@@ -547,13 +716,18 @@ class Molecule(nx.Graph):
         """
         if meta is None:
             meta = {}
-        for idx, interaction in enumerate(self.interactions[type_]):
-            if (interaction.atoms == tuple(atoms)
-                    and interaction.meta.get('version', 0) == meta.get('version', 0)):
+        # The key identifying the interaction is computed once, rather than
+        # once per scanned candidate.
+        atoms = tuple(atoms)
+        version = meta.get('version', 0)
+        interactions = self._mutable_interactions(type_)
+        for idx, interaction in enumerate(interactions):
+            if (interaction.atoms == atoms
+                    and interaction.meta.get('version', 0) == version):
                 new_interaction = Interaction(
-                    atoms=tuple(atoms), parameters=parameters, meta=meta,
+                    atoms=atoms, parameters=parameters, meta=meta,
                 )
-                self.interactions[type_][idx] = new_interaction
+                interactions[idx] = new_interaction
                 break
         else:  # no break
             self.add_interaction(type_, atoms, parameters, meta)
@@ -597,16 +771,20 @@ class Molecule(nx.Graph):
         KeyError
             If the specified interaction could not be found
         """
-        idx = 0
-        for idx, interaction in enumerate(self.interactions[type_]):
+        # Stored interactions always carry their atoms as a tuple, so the
+        # comparison below would never match a list argument without this
+        # coercion.
+        atoms = tuple(atoms)
+        interactions = self._mutable_interactions(type_)
+        for idx, interaction in enumerate(interactions):
             if interaction.atoms == atoms and interaction.meta.get('version', 0) == version:
                 break
         else:  # no break
             msg = ("Can't find interaction of type {} between atoms {} "
                    "and with version {}")
             raise KeyError(msg.format(type_, atoms, version))
-        del self.interactions[type_][idx]
-        if not self.interactions[type_]:
+        del interactions[idx]
+        if not interactions:
             del self.interactions[type_]
 
     def remove_matching_interaction(self, type_, template_interaction):
@@ -625,7 +803,7 @@ class Molecule(nx.Graph):
         """
         for idx, interaction in enumerate(self.interactions[type_]):
             if interaction_match(self, interaction, template_interaction):
-                del self.interactions[type_][idx]
+                del self._mutable_interactions(type_)[idx]
                 break
         else:  # no break
             raise ValueError('Cannot find a matching interaction.')
@@ -644,24 +822,90 @@ class Molecule(nx.Graph):
         collections.abc.Hashable
             All atom indices that match the specified `attrs`
         """
-        for node_idx in self:
-            node = self.nodes[node_idx]
+        # Iterating the underlying node dict skips a NodeView lookup per node.
+        for node_idx, node in self._node.items():
             if attributes_match(node, attrs):
                 yield node_idx
 
+    def evaluate_parameters(self, effectors, match):
+        """
+        Evaluate a batch of link parameter effectors against this molecule.
+
+        The positions of all the involved nodes are gathered once, and all
+        the distances, angles, and dihedral angles are computed in batched
+        numpy operations rather than one small computation per effector.
+        Effectors whose class is not one of the known
+        :class:`LinkParameterEffector` subclasses are evaluated individually,
+        by calling them.
+
+        Parameters
+        ----------
+        effectors: collections.abc.Sequence[LinkParameterEffector]
+            The effectors to evaluate.
+        match: dict
+            The correspondence between the nodes from the link (keys), and
+            the nodes from this molecule (values), as expected by
+            :meth:`LinkParameterEffector.__call__`.
+
+        Returns
+        -------
+        list
+            The value for each effector, in the same order as `effectors`.
+            Values are formatted as strings for the effectors that define a
+            format spec.
+        """
+        effector_keys = [[match[key] for key in effector.keys]
+                         for effector in effectors]
+        # Gather the position of every involved node exactly once; dicts
+        # preserve insertion order, so `rows` maps each node key to its row in
+        # `positions`.
+        rows = {}
+        for keys in effector_keys:
+            for key in keys:
+                if key not in rows:
+                    rows[key] = len(rows)
+        positions = _gather_positions(self, list(rows))
+
+        grouped = defaultdict(list)
+        for idx, effector in enumerate(effectors):
+            grouped[type(effector)].append(idx)
+
+        results = [None] * len(effectors)
+        for effector_class, indices in grouped.items():
+            kernel = _BATCH_EFFECTOR_KERNELS.get(effector_class)
+            if kernel is None:
+                for idx in indices:
+                    results[idx] = effectors[idx](self, match)
+                continue
+            row_indices = np.array([
+                [rows[key] for key in effector_keys[idx]]
+                for idx in indices
+            ])
+            values = kernel(positions, row_indices)
+            for idx, value in zip(indices, values):
+                template = effectors[idx]._format_template
+                if template is not None:
+                    value = template.format(value)
+                results[idx] = value
+        return results
+
     def __getattr__(self, name):
         # TODO: DRY
         if name.startswith('get_') and name.endswith('s'):
             type_ = name[len('get_'):-len('s')]
-            return partial(self.get_interaction, type_)
+            method = partial(self.get_interaction, type_)
         elif name.startswith('add_'):
             type_ = name[len('add_'):]
-            return partial(self.add_interaction, type_)
+            method = partial(self.add_interaction, type_)
         elif name.startswith('remove_'):
             type_ = name[len('remove_'):]
-            return partial(self.remove_interaction, type_)
+            method = partial(self.remove_interaction, type_)
         else:
             raise AttributeError('Unknown attribute "{}".'.format(name))
+        # Cache the partial on the instance: the next lookup of the same name
+        # finds it in the instance dict, and __getattr__ is no longer called.
+        self.__dict__[name] = method
+        return method
 
     def add_node(self, *args, **kwargs):
         super().add_node(*args, **kwargs)
@@ -717,23 +961,35 @@ class Molecule(nx.Graph):
             offset_charge_group = 0
             self.max_node = 0
 
-        correspondence = {}
-        for idx, node in enumerate(molecule.nodes(), start=offset + 1):
-            correspondence[node] = idx
-            new_atom = copy.copy(molecule.nodes[node])
-            new_atom['resid'] = (new_atom.get('resid', 1) + residue_offset)
-            new_atom['charge_group'] = (new_atom.get('charge_group', 1)
-                                        + offset_charge_group)
-            self.add_node(idx, **new_atom)
+        # The new node dicts are built in a single pass and inserted in bulk:
+        # building a dict literal is cheaper than copy.copy followed by item
+        # assignments, and add_nodes_from amortizes the per-node bookkeeping
+        # of add_node.
+        node_view = molecule.nodes
+        correspondence = {
+            node: idx
+            for idx, node in enumerate(molecule.nodes(), start=offset + 1)
+        }
+        new_nodes = [
+            (idx, {**node_view[node],
+                   'resid': node_view[node].get('resid', 1) + residue_offset,
+                   'charge_group': (node_view[node].get('charge_group', 1)
+                                    + offset_charge_group)})
+            for node, idx in correspondence.items()
+        ]
+        self.add_nodes_from(new_nodes)
+        if self.max_node:
+            self.max_node += len(new_nodes)
 
         for name, interactions in molecule.interactions.items():
             for interaction in interactions:
                 atoms = tuple(correspondence[atom] for atom in interaction.atoms)
                 self.add_interaction(name, atoms, interaction.parameters, interaction.meta)
-        for node1, node2 in molecule.edges:
-            if correspondence[node1] != correspondence[node2]:
-                attrs = molecule.edges[(node1, node2)]
-                self.add_edge(correspondence[node1], correspondence[node2], **attrs)
+        self.add_edges_from(
+            (correspondence[node1], correspondence[node2], attrs)
+            for node1, node2, attrs in molecule.edges(data=True)
+            if correspondence[node1] != correspondence[node2]
+        )
         # merge the citation sets
         self.citations.update(molecule.citations)
         # Merge the log entries
@@ -835,7 +1091,11 @@ class Molecule(nx.Graph):
         -------
         bool
         """
-        # We first check that the node keys match between the two molecules.
+        # Comparing the number of nodes first saves building the key lists
+        # for molecules that cannot possibly match.
+        if len(self.nodes) != len(other.nodes):
+            return False
+        # We then check that the node keys match between the two molecules.
         # The order matters here, and we count on the fact that Molecules are
         # OrderedDicts.
         if list(self.nodes.keys()) != list(other.nodes.keys()):
@@ -872,6 +1132,10 @@ class Molecule(nx.Graph):
         -------
         bool
         """
+        # If the number of edges differs, we can save building the edge
+        # dictionaries altogether.
+        if len(self.edges) != len(other.edges):
+            return False
         # The items of `graph.edges(data=True)` are formatted as
         # (from, to, {dict of attributes}).
         edges_self = {
@@ -901,8 +1165,13 @@ class Molecule(nx.Graph):
         -------
         collections.abc.Generator
         """
-        residue_graph = graph_utils.make_residue_graph(self)
-        return (tuple(residue_graph.nodes[res]['graph'].nodes) for res in sorted(residue_graph.nodes))
+        # Only the partition of the nodes into residues is needed here, so we
+        # skip building the full residue graph with its subgraphs, contracted
+        # edges, and density attributes. The residues are ordered the same way
+        # :func:`~vermouth.graph_utils.make_residue_graph` orders them: by
+        # their lowest node key.
+        residues = graph_utils.collect_residues(self)
+        return (tuple(residue) for residue in sorted(residues.values(), key=min))
 
     def edges_between(self, n_bunch1, n_bunch2, data=False):
         """
@@ -922,15 +1191,18 @@ class Molecule(nx.Graph):
             A list of tuples of edges in this molecule. The first element of
             the tuple will be in `n_bunch1`, the second element in `n_bunch2`.
         """
-        set_1 = set(n_bunch1)
         set_2 = set(n_bunch2)
-        for node1 in set_1:
-            cross = set_2 & set(self[node1])
+        adjacency = self._adj
+        # `dict.fromkeys` removes eventual duplicates from `n_bunch1` while
+        # keeping its order, so the output order is deterministic. Intersecting
+        # the adjacency keys directly avoids building a set per node.
+        for node1 in dict.fromkeys(n_bunch1):
+            cross = adjacency[node1].keys() & set_2
             for node2 in cross:
                 if not data:
                     yield (node1, node2)
                 else:
-                    yield (node1, node2, self.edges[node1, node2])
+                    yield (node1, node2, adjacency[node1][node2])
 
     def _remove_interactions_with_node(self, node):
         """
@@ -945,7 +1217,7 @@ class Molecule(nx.Graph):
             # consecutive interactions that should be removed.
             for interaction in list(interactions):
                 if node in interaction.atoms:
-                    self.interactions[name].remove(interaction)
+                    self._mutable_interactions(name).remove(interaction)
 
         for interaction_type in list(self.interactions):
             if not self.interactions[interaction_type]:
@@ -1095,8 +1367,7 @@ class Block(Molecule):
         -------
         collections.abc.Iterator[dict]
         """
-        for node in self.nodes():
-            node_attr = self.nodes[node]
+        for node_attr in self._node.values():
             # In pre-blocks, some nodes correspond to particles in neighboring
             # residues. These node do not carry particle information and should
             # not appear as particles.
@@ -1105,24 +1376,30 @@ class Block(Molecule):
 
     def guess_angles(self):
         """
-        Generates all possible triplets of node indices that correspond to
-        angles.
+        Lists all possible triplets of node indices that correspond to angles.
 
-        Yields
-        ------
-        tuple[collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable]
+        Returns
+        -------
+        list[tuple[collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable]]
             All possible angles.
         """
-        for a in self.nodes():
-            for b in self.neighbors(a):
-                for c in self.neighbors(b):
-                    if c == a:
-                        continue
-                    yield (a, b, c)
+        # Snapshotting the adjacency as tuples removes the repeated
+        # neighbors() dispatch and view wrapping from the nested loops, and
+        # lets the list comprehension run without per-level generator
+        # overhead. Taking the central atom as the outer loop visits the same
+        # triplets as walking a-b-c paths from every `a`.
+        neighbors = {node: tuple(adjacent) for node, adjacent in self._adj.items()}
+        return [
+            (atom_a, atom_b, atom_c)
+            for atom_b, adjacent in neighbors.items()
+            for atom_a in adjacent
+            for atom_c in adjacent
+            if atom_a != atom_c
+        ]
 
     def guess_dihedrals(self, angles=None):
         """
-        Generates all possible quadruplets of node indices that correspond to
+        Lists all possible quadruplets of node indices that correspond to
         torsion angles.
 
         Parameters
@@ -1131,16 +1408,19 @@ class Block(Molecule):
             All possible angles from which to start looking for torsion angles.
             Generated from :meth:`guess_angles` if not provided.
 
-        Yields
-        ------
-        tuple[collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable]
+        Returns
+        -------
+        list[tuple[collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable, collections.abc.Hashable]]
             All possible torsion angles.
         """
         angles = angles if angles is not None else self.guess_angles()
-        for a, b, c in angles:
-            for d in self.neighbors(c):
-                if d not in (a, b):
-                    yield (a, b, c, d)
+        neighbors = {node: tuple(adjacent) for node, adjacent in self._adj.items()}
+        return [
+            (atom_a, atom_b, atom_c, atom_d)
+            for atom_a, atom_b, atom_c in angles
+            for atom_d in neighbors[atom_c]
+            if atom_d not in (atom_a, atom_b)
+        ]
 
     def has_dihedral_around(self, center):
         """
@@ -1156,9 +1436,11 @@ class Block(Molecule):
         -------
         bool
         """
-        all_centers = [tuple(dih['atoms'][1:-1])
-                       for dih in self.interactions.get('dihedrals', [])]
-        return tuple(center) in all_centers
+        # `any` short-circuits on the first hit, so we do not build the full
+        # list of centers for every query.
+        center = tuple(center)
+        return any(tuple(dih.atoms[1:-1]) == center
+                   for dih in self.interactions.get('dihedrals', []))
 
     def has_improper_around(self, center):
         """
@@ -1174,9 +1456,9 @@ class Block(Molecule):
         -------
         bool
         """
-        all_centers = [tuple(dih.atoms[1:-1])
-                       for dih in self.interactions.get('impropers', [])]
-        return tuple(center) in all_centers
+        center = tuple(center)
+        return any(tuple(dih.atoms[1:-1]) == center
+                   for dih in self.interactions.get('impropers', []))
 
     def to_molecule(self, atom_offset=0, offset_resid=0, offset_charge_group=0,
                     force_field=None, default_attributes=None):
@@ -1209,28 +1491,33 @@ class Block(Molecule):
         mol.citations = self.citations
         mol.log_entries = copy.deepcopy(self.log_entries)
 
+        # The nodes are built in one pass and inserted in bulk, the same way
+        # merge_molecule does it.
+        node_view = self.nodes
+        new_nodes = []
         for idx, node in enumerate(self.nodes, start=atom_offset):
             name_to_idx[node] = idx
-            atom = self.nodes[node]
-            new_atom = default_attributes.copy()
-            new_atom.update(atom)
+            new_atom = {**default_attributes, **node_view[node]}
             new_atom['resid'] = (new_atom.get('resid', 1) + offset_resid)
             new_atom['charge_group'] = (new_atom.get('charge_group', 1) +
                                         offset_charge_group)
-            mol.add_node(idx, **new_atom)
+            new_nodes.append((idx, new_atom))
+        mol.add_nodes_from(new_nodes)
+        # The interaction atoms all come from `name_to_idx`, so the membership
+        # check done by add_interaction is not needed here.
         for name, interactions in self.interactions.items():
-            for interaction in interactions:
-                atoms = tuple(
-                    name_to_idx[atom] for atom in interaction.atoms
-                )
-                mol.add_interaction(
-                    name, atoms,
-                    interaction.parameters,
-                    meta=interaction.meta
+            mol.interactions[name].extend(
+                Interaction(
+                    atoms=tuple(name_to_idx[atom] for atom in interaction.atoms),
+                    parameters=interaction.parameters,
+                    meta=interaction.meta,
                 )
-        for nodea, nodeb, attrs in self.edges(data=True):
-            edge = (nodea, nodeb)
-            mol.add_edge(*(name_to_idx[node] for node in edge), **attrs)
+                for interaction in interactions
+            )
+        mol.add_edges_from(
+            (name_to_idx[nodea], name_to_idx[nodeb], attrs)
+            for nodea, nodeb, attrs in self.edges(data=True)
+        )
 
         try:
             mol.nrexcl = self.nrexcl
@@ -1370,11 +1657,29 @@ def attributes_match(attributes, template_attributes, ignore_keys=()):
     Returns
     -------
     bool
+
+    Notes
+    -----
+    The result of this function must **not** be memoized on the identity of
+    its arguments: node attribute dicts are mutated in place while links are
+    being applied (e.g. by 'replace' directives in
+    :class:`~vermouth.processors.do_links.DoLinks`), and ``id()`` values are
+    recycled once a dict is garbage collected, so a cache keyed on the
+    argument ids can silently return answers for stale or unrelated dicts.
     """
-    for attr, value in template_attributes.items():
-        if attr in ignore_keys:
-            continue
-        if attributes.get(attr) != value:
+    # This function is the innermost loop of link matching. Binding the
+    # `get` method once and only filtering on `ignore_keys` when there are
+    # keys to ignore saves measurable time over many calls. Plain equality is
+    # tested first; the predicate check only runs on a mismatch, so the
+    # isinstance call stays off the common path.
+    attributes_get = attributes.get
+    if ignore_keys:
+        items = [item for item in template_attributes.items()
+                 if item[0] not in ignore_keys]
+    else:
+        items = template_attributes.items()
+    for attr, value in items:
+        if attributes_get(attr) != value:
             if isinstance(value, LinkPredicate) and value.match(attributes, attr):
                 continue
             return False
@@ -1409,19 +1714,29 @@ def interaction_match(molecule, interaction, template_interaction):
     --------
     attributes_match
     """
-    atoms_match = tuple(template_interaction.atoms) == tuple(interaction.atoms)
-    parameters_match = (
-        not template_interaction.parameters
-        or tuple(template_interaction.parameters) == tuple(interaction.parameters)
-    )
-    if atoms_match and parameters_match:
-        try:
-            atom_attrs = template_interaction.atom_attrs
-        except AttributeError:
-            atom_attrs = [{}, ] * len(template_interaction.atoms)
-        nodes = [molecule.nodes[atom] for atom in interaction.atoms]
-        for atom, template_atom in zip(nodes, atom_attrs):
-            if not attributes_match(atom, template_atom):
+    # Atoms are stored as tuples by add_interaction, so most of the time the
+    # comparisons below need no conversion; each test returns as early as
+    # possible.
+    atoms = interaction.atoms
+    if not isinstance(atoms, tuple):
+        atoms = tuple(atoms)
+    template_atoms = template_interaction.atoms
+    if not isinstance(template_atoms, tuple):
+        template_atoms = tuple(template_atoms)
+    if template_atoms != atoms:
+        return False
+    template_parameters = template_interaction.parameters
+    if (template_parameters
+            and tuple(template_parameters) != tuple(interaction.parameters)):
+        return False
+    # Only DeleteInteraction templates carry atom attributes; for plain
+    # Interaction templates we skip the per-atom loop entirely. Empty
+    # attribute dicts always match, so the node lookup is skipped for
+    # them as well.
+    atom_attrs = getattr(template_interaction, 'atom_attrs', None)
+    if atom_attrs is not None:
+        nodes = molecule.nodes
+        for atom, template_atom in zip(atoms, atom_attrs):
+            if template_atom and not attributes_match(nodes[atom], template_atom):
                 return False
-        return attributes_match(interaction.meta, template_interaction.meta)
-    return False
+    return attributes_match(interaction.meta, template_interaction.meta)
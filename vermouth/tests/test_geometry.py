@@ -157,6 +157,60 @@ def test_dihedral_phase(points, angle):
     assert np.allclose(calc_angle, angle_phase)
 
 
+@pytest.mark.parametrize(
+    'points, angle',
+    itertools.chain(
+        _generate_test_angles(10),
+        ((np.array([[0,  3, 0], [0, 0, 0], [0, 6, 0]]), 0), ),  # pylint: disable=bad-whitespace
+        ((np.array([[0, -9, 0], [0, 0, 0], [0, 2, 0]]), np.pi), ),
+    )
+)
+def test_angle_degrees(points, angle):
+    calc_angle = geometry.angle_degrees(points.astype(float))
+    assert np.allclose(calc_angle, np.degrees(angle))
+
+
+@pytest.mark.parametrize(
+    'points, angle',
+    itertools.chain(
+        _generate_test_dihedrals(10),
+        ((np.array([[0,  3, 0], [0, 0, 0], [4, 0, 0], [7, 6, 0]]), 0), ),  # pylint: disable=bad-whitespace
+        ((np.array([[0, -9, 0], [0, 0, 0], [4, 0, 0], [5, 6, 0]]), np.pi), ),
+    )
+)
+def test_dihedral_degrees(points, angle):
+    calc_angle = geometry.dihedral_degrees(points.astype(float))
+    # +180 and -180 are the same angle; we normalize them to 180
+    if np.allclose(calc_angle, -180):
+        calc_angle *= -1
+    if np.allclose(angle, -np.pi):
+        angle *= -1
+    assert np.allclose(calc_angle, np.degrees(angle))
+
+
+@pytest.mark.parametrize(
+    'points, angle',
+    itertools.chain(
+        _generate_test_dihedrals(10),
+        ((np.array([[0,  3, 0], [0, 0, 0], [4, 0, 0], [7, 6, 0]]), 0), ),  # pylint: disable=bad-whitespace
+        ((np.array([[0, -9, 0], [0, 0, 0], [4, 0, 0], [5, 6, 0]]), np.pi), ),
+    )
+)
+def test_dihedral_phase_degrees(points, angle):
+    angle_phase = angle + np.pi
+    if angle_phase > np.pi:
+        angle_phase -= 2 * np.pi
+    if angle_phase < -np.pi:
+        angle_phase += 2 * np.pi
+    calc_angle = geometry.dihedral_phase_degrees(points.astype(float))
+    # +180 and -180 are the same angle; we normalize them to 180
+    if np.allclose(calc_angle, -180):
+        calc_angle *= -1
+    if np.allclose(angle_phase, -np.pi):
+        angle_phase *= -1
+    assert np.allclose(calc_angle, np.degrees(angle_phase))
+
+
 def test_distance_matrix():
     # This array of coordinates was generated using:
     #    coordinates = (
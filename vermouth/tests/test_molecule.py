@@ -981,6 +981,69 @@ def test_link_parameter_effector_diff_class(left_class, right_class):
     assert left != right
 
 
+def test_freeze():
+    """
+    Test that freeze converts the interaction storage to tuples, and that the
+    mutating methods thaw it back transparently.
+    """
+    molecule = vermouth.molecule.Molecule()
+    molecule.add_nodes_from([1, 2, 3])
+    molecule.add_interaction('bonds', (1, 2), ['1', '0.2'])
+    molecule.add_interaction('bonds', (2, 3), ['1', '0.3'])
+    molecule.add_interaction('angles', (1, 2, 3), ['2', '120'])
+
+    molecule.freeze()
+    assert all(isinstance(interactions, tuple)
+               for interactions in molecule.interactions.values())
+
+    # Mutating a frozen category thaws it.
+    molecule.remove_interaction('bonds', (1, 2))
+    assert molecule.interactions['bonds'] == [
+        Interaction(atoms=(2, 3), parameters=['1', '0.3'], meta={}),
+    ]
+    # Untouched categories stay frozen.
+    assert isinstance(molecule.interactions['angles'], tuple)
+
+    molecule.add_interaction('bonds', (1, 2), ['1', '0.2'])
+    assert len(molecule.interactions['bonds']) == 2
+
+
+def test_evaluate_parameters():
+    """
+    Test that batch evaluation of parameter effectors gives the same results
+    as calling each effector individually.
+    """
+    molecule = vermouth.molecule.Molecule()
+    positions = np.array([
+        [0.0, 0.0, 0.0],
+        [1.0, 0.3, -0.2],
+        [1.8, 1.1, 0.4],
+        [2.5, 0.9, 1.6],
+        [3.1, 2.0, 1.9],
+    ])
+    for idx, position in enumerate(positions):
+        molecule.add_node(idx, position=position)
+    match = {'A{}'.format(idx): idx for idx in range(len(positions))}
+
+    effectors = [
+        vermouth.molecule.ParamDistance(['A0', 'A1']),
+        vermouth.molecule.ParamAngle(['A0', 'A1', 'A2'], format_spec='.2f'),
+        vermouth.molecule.ParamDihedral(['A0', 'A1', 'A2', 'A3']),
+        vermouth.molecule.ParamDihedralPhase(['A1', 'A2', 'A3', 'A4']),
+        vermouth.molecule.ParamDistance(['A2', 'A4'], format_spec='0.3f'),
+    ]
+
+    results = molecule.evaluate_parameters(effectors, match)
+    references = [effector(molecule, match) for effector in effectors]
+
+    assert len(results) == len(references)
+    for result, reference in zip(results, references):
+        if isinstance(reference, str):
+            assert result == reference
+        else:
+            assert np.allclose(result, reference)
+
+
 @hypothesis.settings(suppress_health_check=[hypothesis.HealthCheck.too_slow])
 @hypothesis.given(random_molecule())
 def test_molecule_equal(mol):
@@ -1289,6 +1352,8 @@ def test_to_molecule():
     ([], [], [], {}, {}),
     # interactions that all need to be removed
     ([1, 2], [(1, 2)], [('bond', (1, 2), {})], {'type_': 'bond', "atoms": (1, 2)}, {}),
+    # atoms given as a list must match the stored tuple
+    ([1, 2], [(1, 2)], [('bond', (1, 2), {})], {'type_': 'bond', "atoms": [1, 2]}, {}),
     # Molecule with interactions of different types of which some need to be removed
     (
         [1, 2, 3, 4, 5, 6, 7],
@@ -1339,6 +1404,26 @@ def test_remove_interaction(atoms, bonds, interactions, removed, expected):
     assert molecule.interactions == expected
 
 
+def test_guess_angles_and_dihedrals():
+    """
+    Test that guess_angles and guess_dihedrals list all the bonded triplets
+    and quadruplets, in both directions.
+    """
+    test_block = vermouth.molecule.Block()
+    test_block.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D')])
+
+    angles = test_block.guess_angles()
+    ref_angles = [
+        ('A', 'B', 'C'), ('C', 'B', 'A'),
+        ('B', 'C', 'D'), ('D', 'C', 'B'),
+    ]
+    assert sorted(angles) == sorted(ref_angles)
+
+    dihedrals = test_block.guess_dihedrals(angles=angles)
+    ref_dihedrals = [('A', 'B', 'C', 'D'), ('D', 'C', 'B', 'A')]
+    assert sorted(dihedrals) == sorted(ref_dihedrals)
+
+
 def test_merge_molecule():
     """
     Test if the merge molecule function gives